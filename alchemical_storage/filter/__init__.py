@@ -1,8 +1,9 @@
 """Classes to apply where and order_by clauses to sqlalchemy queries."""
 
-from .filter import FilterMap, OrderByMap
+from .filter import FilterMap, NullFilterMap, OrderByMap
 
 __all__ = [
     "FilterMap",
+    "NullFilterMap",
     "OrderByMap",
 ]
@@ -1,5 +1,9 @@
 """Define filter and order_by exceptions."""
 
 
+class NullFilterException(Exception):
+    """Raised when a null filter query parameter value is invalid."""
+
+
 class OrderByException(Exception):
     """Raised when an order_by query parameter is invalid."""
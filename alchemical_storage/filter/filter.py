@@ -2,24 +2,50 @@
 used to map filters and order_by attributes to sqlalchemy statements."""
 
 import functools
-import importlib
 import operator
-from typing import Any, Callable, Generator
+import sys
+from types import ModuleType
+from typing import Any, Callable
 
 from sqlalchemy.sql.expression import desc
 
-from alchemical_storage.filter.exc import OrderByException
+from alchemical_storage.filter.exc import NullFilterException, OrderByException
+from alchemical_storage.lib import get_module, resolve_attribute
 from alchemical_storage.visitor import StatementVisitor, T
 
 # pylint: disable=too-few-public-methods
 
 
+def _matching_items(configured: dict[str, Any], given: dict[str, Any]):
+    """Yield the ``(key, value)`` pairs of ``given`` whose keys are configured,
+    iterating whichever dict is smaller."""
+    if len(configured) < len(given):
+        return ((attr, given[attr]) for attr in configured if attr in given)
+    return ((attr, value) for attr, value in given.items() if attr in configured)
+
+
+# Error-message templates are module constants so the literals are built and
+# interned once; they are only formatted at the raise sites.
+_NULL_FILTER_ERR = "Unknown null filter value: {}"
+_ORDER_BY_ERR = "Unknown order_by attribute: {}"
+
+_OPERATOR_METHODS = {
+    operator.eq: "__eq__",
+    operator.ne: "__ne__",
+    operator.lt: "__lt__",
+    operator.le: "__le__",
+    operator.gt: "__gt__",
+    operator.ge: "__ge__",
+}
+
+
 class FilterMap(StatementVisitor):
     """Initialize the filter mapper.
 
     Args:
         filters (dict[str, Any]): A dictionary of filters
-        import_from (str): The module to import Model classes from
+        import_from (str | ModuleType): The module to import Model classes from, or
+            the module itself
 
     Example:
         .. code-block:: python
@@ -37,10 +63,12 @@ class FilterMap(StatementVisitor):
 
     """
 
+    __slots__ = ("_module", "filters", "_clause_cache")
+
     filters: dict[str, Callable]
 
-    def __init__(self, filters: dict[str, Any], import_from: str) -> None:
-        self.__module = importlib.import_module(import_from)
+    def __init__(self, filters: dict[str, Any], import_from: str | ModuleType) -> None:
+        self._module = get_module(import_from)
         self.filters = {}
         for filter_, exprs in filters.items():
             if isinstance(exprs, tuple):
@@ -48,13 +76,12 @@ class FilterMap(StatementVisitor):
             else:
                 attr = exprs
                 op_ = operator.eq
-            get_by = None
-            for child in attr.split("."):
-                if not get_by:
-                    get_by = getattr(self.__module, child)
-                else:
-                    get_by = getattr(get_by, child)
-            self.filters[filter_] = functools.partial(op_, get_by)
+            get_by = resolve_attribute(self._module, attr)
+            if method := _OPERATOR_METHODS.get(op_):
+                self.filters[filter_] = getattr(get_by, method)
+            else:
+                self.filters[filter_] = functools.partial(op_, get_by)
+        self._clause_cache = functools.lru_cache(maxsize=256)(self._build_clause)
 
     def visit_statement(self, statement: T, params: dict[str, Any]):
         """Apply filters to an sqlalchemy query. Each key in ``params`` corresponds to a
@@ -74,14 +101,102 @@ class FilterMap(StatementVisitor):
             on both select statements and column elements.
 
         """
+        # pylint: disable-next=no-member; pylint misinfers the dict keys view
+        if not params or self.filters.keys().isdisjoint(params):
+            return statement
         return statement.where(*self._generate_whereclauses(params))
 
-    def _generate_whereclauses(
-        self, given_filters: dict[str, Any]
-    ) -> Generator[Any, None, None]:
-        for attr, filtered_by in given_filters.items():
-            if attr in self.filters:
-                yield self.filters[attr](filtered_by)
+    def _build_clause(self, attr: str, filtered_by: Any) -> Any:
+        return self.filters[attr](filtered_by)
+
+    def _generate_whereclauses(self, given_filters: dict[str, Any]) -> list[Any]:
+        clauses = []
+        for attr, filtered_by in _matching_items(self.filters, given_filters):
+            try:
+                clauses.append(self._clause_cache(attr, filtered_by))
+            except TypeError:
+                # Unhashable filter values cannot be cached; build the
+                # clause directly.
+                clauses.append(self.filters[attr](filtered_by))
+        return clauses
+
+
+class NullFilterMap(StatementVisitor):
+    """A mapper to convert filter attributes to sqlalchemy "is null"/"is not null"
+    expressions.
+
+    Args:
+        filters (dict[str, str]): A dictionary of filters, where the key is the filter
+            name and the value is the column to compare against null
+        import_from (str | ModuleType): The module to import Model classes from, or
+            the module itself
+        null_identifiers (tuple[str, str]): The parameter values identifying a null
+            and a not-null filter, respectively (Optional, defaults to
+            ``("null", "not-null")``)
+
+    Example:
+        .. code-block:: python
+
+            null_filter_visitor = NullFilterMap({
+                "deleted": 'Game.deleted_at',
+            }, 'your_models_module.models')
+
+    Note:
+        The identifiers are compiled into a value-to-operator table at
+        construction time, so matching an incoming parameter value is a single
+        dict probe.
+
+    """
+
+    __slots__ = ("_module", "filters", "null_identifiers", "_ops")
+
+    filters: dict[str, Any]
+    null_identifiers: tuple[str, str]
+
+    def __init__(
+        self,
+        filters: dict[str, str],
+        import_from: str | ModuleType,
+        null_identifiers: tuple[str, str] = ("null", "not-null"),
+    ) -> None:
+        self._module = get_module(import_from)
+        self.filters = {}
+        for filter_, attr in filters.items():
+            self.filters[filter_] = resolve_attribute(self._module, attr)
+        null, not_null = null_identifiers
+        self.null_identifiers = (sys.intern(null), sys.intern(not_null))
+        self._ops = {
+            null: operator.methodcaller("is_", None),
+            not_null: operator.methodcaller("is_not", None),
+        }
+
+    def visit_statement(self, statement: T, params: dict[str, Any]):
+        """Apply null filters to an sqlalchemy query. Each key in ``params``
+        corresponds to a filter in ``self.filters``. If the key is not in
+        ``self.filters``, it is ignored.
+
+        Args:
+            statement (T): The sqlalchemy statement to apply filters to
+            params (dict[str, Any]): The filters to apply
+
+        Returns:
+            T: The filtered sqlalchemy statement
+
+        """
+        # pylint: disable-next=no-member; pylint misinfers the dict keys view
+        if not params or self.filters.keys().isdisjoint(params):
+            return statement
+        return statement.where(*self._generate_where_clauses(params))
+
+    def _generate_where_clauses(self, given_filters: dict[str, Any]) -> list[Any]:
+        ops = self._ops
+        clauses = []
+        for attr, filtered_by in _matching_items(self.filters, given_filters):
+            op_ = ops.get(filtered_by)
+            if op_ is None:
+                raise NullFilterException(_NULL_FILTER_ERR.format(filtered_by))
+            clauses.append(op_(self.filters[attr]))
+        return clauses
 
 
 class OrderByMap(StatementVisitor):
@@ -91,7 +206,8 @@ class OrderByMap(StatementVisitor):
         order_by_attributes (dict[str, Any]): A dictionary of order_by attributes, where
             the key is the attribute name and the value is the column or label to order
             by.
-        import_from (str): The module to import Model classes from
+        import_from (str | ModuleType): The module to import Model classes from, or
+            the module itself
 
     Example:
         .. code-block:: python
@@ -103,19 +219,29 @@ class OrderByMap(StatementVisitor):
 
     """
 
+    __slots__ = ("order_by_attributes", "_descending", "_compile")
+
     order_by_attributes: dict[str, Any]
+    _descending: dict[str, Any]
 
-    def __init__(self, order_by_attributes: dict[str, Any], import_from: str) -> None:
-        module = importlib.import_module(import_from)
+    def __init__(
+        self, order_by_attributes: dict[str, Any], import_from: str | ModuleType
+    ) -> None:
+        module = get_module(import_from)
         self.order_by_attributes = {}
         for attr, column in order_by_attributes.items():
             if "." in column:
-                model, model_attr = column.split(".")
-                order_by = getattr(getattr(module, model), model_attr)
+                order_by = resolve_attribute(module, column)
             else:
                 order_by = column
 
             self.order_by_attributes[attr] = order_by
+        # The descending expression for each attribute is fixed, so build the
+        # ``DESC`` wrappers once instead of per parsed token.
+        self._descending = {
+            attr: desc(order_by) for attr, order_by in self.order_by_attributes.items()
+        }
+        self._compile = functools.lru_cache(maxsize=128)(self._compile_impl)
 
     def visit_statement(self, statement, params: dict[str, Any]):
         """Apply order_by to an sqlalchemy query. Ignored if ``order_by`` key is not in
@@ -131,19 +257,21 @@ class OrderByMap(StatementVisitor):
         """
         if "order_by" not in params:
             return statement
-        return statement.order_by(*self._generate_order_by(params["order_by"]))
+        return statement.order_by(*self._compile(params["order_by"]))
+
+    def _compile_impl(self, order_by: str) -> tuple[Any, ...]:
+        """Parse an ``order_by`` string into a tuple of order_by expressions.
 
-    def _generate_order_by(self, order_by: str):
+        Results are memoized per instance, so repeated ``order_by`` strings skip
+        the parse entirely. Invalid strings raise before anything is cached.
+        """
+        clauses = []
         for attr in order_by.split(","):
-            if attr.startswith("-"):
-                order = "desc"
-                attr = attr[1:]
-            else:
-                order = "asc"
-            if attr in self.order_by_attributes:
-                if order == "desc":
-                    yield desc(self.order_by_attributes[attr])
-                else:
-                    yield self.order_by_attributes[attr]
-            else:
-                raise OrderByException(f"Unknown order_by attribute: {attr}")
+            descending = attr[:1] == "-"
+            key = attr[1:] if descending else attr
+            lookup = self._descending if descending else self.order_by_attributes
+            entry = lookup.get(key)
+            if entry is None:
+                raise OrderByException(_ORDER_BY_ERR.format(key))
+            clauses.append(entry)
+        return tuple(clauses)
@@ -1,8 +1,9 @@
 """Classes for adding joins to sqlalchemy queries."""
 
-import importlib
+from types import ModuleType
 from typing import Any
 
+from alchemical_storage.lib import get_module, resolve_attribute
 from alchemical_storage.visitor import StatementVisitor, T
 
 JoinExpression = str | tuple[Any, ...]
@@ -12,7 +13,8 @@ class JoinMap(StatementVisitor):
     """Class for adding joins to sqlalchemy queries.
 
     Args:
-        import_from (str): The module to import the models/entities from.
+        import_from (str | ModuleType): The module to import the models/entities
+            from, or the module itself.
         param_names (tuple[str, ...]): The names of the parameters that will trigger
             the join. Any of these parameters being in the ``params`` dict passed to
             ``visit_statement`` will trigger the join.
@@ -30,29 +32,26 @@ class JoinMap(StatementVisitor):
 
     """
 
+    __slots__ = ("_module", "param_names", "_param_names_set", "joins")
+
     joins: tuple[tuple[Any, ...], ...]
 
     def __init__(
         self,
-        import_from: str,
+        import_from: str | ModuleType,
         param_names: tuple[str, ...],
         *joins: JoinExpression,
     ):
-        self.__module = importlib.import_module(import_from)
+        self._module = get_module(import_from)
         self.param_names = param_names
+        self._param_names_set = frozenset(param_names)
         _joins = []
         for join in joins:
             _joins.append(self._get_join(join))
         self.joins = tuple(_joins)
 
     def _import_entity(self, entity: str) -> Any:
-        get_by = None
-        for child in entity.split("."):
-            if not get_by:
-                get_by = getattr(self.__module, child)
-            else:
-                get_by = getattr(get_by, child)
-        return get_by
+        return resolve_attribute(self._module, entity)
 
     def _get_join(self, join: JoinExpression) -> tuple[Any, ...]:
         if isinstance(join, str):
@@ -69,7 +68,9 @@ class JoinMap(StatementVisitor):
         return (get_by, *processed_joins)
 
     def visit_statement(self, statement: T, params: dict[str, Any]) -> T:
-        if set(params.keys()).intersection(self.param_names):
+        if not params:
+            return statement
+        if not self._param_names_set.isdisjoint(params):
             for join in self.joins:
                 statement = statement.join(*join)
         return statement
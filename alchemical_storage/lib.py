@@ -0,0 +1,58 @@
+"""Shared helpers for the alchemical_storage package."""
+
+import functools
+import importlib
+import operator
+from types import ModuleType
+from typing import Any
+
+
+@functools.lru_cache(maxsize=None)
+def _import_module(import_from: str) -> ModuleType:
+    return importlib.import_module(import_from)
+
+
+def get_module(import_from: str | ModuleType) -> ModuleType:
+    """Resolve a module from its dotted name.
+
+    String lookups are memoized so that the many visitors typically built at app
+    startup skip even the ``sys.modules`` bookkeeping done by ``importlib``.
+    Module objects are passed through unchanged.
+
+    Args:
+        import_from (str | ModuleType): The module, or its dotted name
+
+    Returns:
+        ModuleType: The resolved module
+
+    """
+    if isinstance(import_from, ModuleType):
+        return import_from
+    return _import_module(import_from)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_attribute(module_name: str, dotted_path: str) -> Any:
+    return operator.attrgetter(dotted_path)(_import_module(module_name))
+
+
+def resolve_attribute(import_from: str | ModuleType, dotted_path: str) -> Any:
+    """Resolve a dotted attribute path (e.g. ``"Model.attr"``) against a module.
+
+    Module objects are resolved against directly, so dynamically created
+    modules need not be importable by name. Map definitions are static per
+    process, so string lookups are memoized by module name and path; maps
+    sharing the same definitions reuse the resolved object instead of
+    re-walking the attribute chain.
+
+    Args:
+        import_from (str | ModuleType): The module, or its dotted name
+        dotted_path (str): The attribute path to resolve
+
+    Returns:
+        Any: The resolved attribute
+
+    """
+    if isinstance(import_from, ModuleType):
+        return operator.attrgetter(dotted_path)(import_from)
+    return _resolve_attribute(import_from, dotted_path)
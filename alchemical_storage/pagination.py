@@ -0,0 +1,81 @@
+"""Classes for applying pagination to sqlalchemy queries."""
+
+import operator
+from typing import Any, Callable, Optional
+
+from alchemical_storage.visitor import StatementVisitor, T
+
+
+class PaginationMap(StatementVisitor):
+    """Class for applying limit/offset pagination to sqlalchemy queries.
+
+    Args:
+        param_name (str): The name of the parameter holding the page-params object.
+            The pagination is skipped if it is not in the ``params`` dict passed to
+            ``visit_statement`` (Optional, defaults to ``"page_params"``)
+        page_size_attr (str): The attribute of the page-params object holding the
+            page size (Optional, defaults to ``"page_size"``)
+        first_item_attr (str): The attribute of the page-params object holding the
+            offset of the first item (Optional, defaults to ``"first_item"``)
+        getter_func (Optional[Callable[[Any, str], Any]]): The function used to read
+            the attributes from the page-params object (Optional, defaults to
+            ``getattr``)
+
+    Example:
+        .. code-block:: python
+
+            from alchemical_storage.pagination import PaginationMap
+
+            pagination_visitor = PaginationMap()
+
+    Note:
+        Pagination is also skipped when the page-params object reports a falsy
+        page size. To disable pagination, omit the page-params key rather than
+        passing a zero-size sentinel; that keeps the statement shape stable for
+        SQLAlchemy's compiled-statement cache.
+
+    """
+
+    __slots__ = ("_param_name", "_get_size", "_get_first")
+
+    _get_size: Callable[[Any], Any]
+    _get_first: Callable[[Any], Any]
+
+    def __init__(
+        self,
+        param_name: str = "page_params",
+        page_size_attr: str = "page_size",
+        first_item_attr: str = "first_item",
+        getter_func: Optional[Callable[[Any, str], Any]] = None,
+    ) -> None:
+        self._param_name = param_name
+        if getter_func is None or getter_func is getattr:
+            self._get_size = operator.attrgetter(page_size_attr)
+            self._get_first = operator.attrgetter(first_item_attr)
+        else:
+            self._get_size = lambda page_params: getter_func(
+                page_params, page_size_attr
+            )
+            self._get_first = lambda page_params: getter_func(
+                page_params, first_item_attr
+            )
+
+    def visit_statement(self, statement: T, params: dict[str, Any]) -> T:
+        """Apply limit and offset to an sqlalchemy query. Ignored if the page-params
+        key is not in ``params`` or the page size is falsy.
+
+        Args:
+            statement (T): The sqlalchemy statement to apply pagination to
+            params (dict[str, Any]): The parameters to read the page-params from
+
+        Returns:
+            T: The paginated sqlalchemy statement
+
+        """
+        page_params = params.get(self._param_name)
+        if page_params is None:
+            return statement
+        page_size = self._get_size(page_params)
+        if not page_size:
+            return statement
+        return statement.limit(page_size).offset(self._get_first(page_params))
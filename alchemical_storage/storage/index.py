@@ -1,5 +1,6 @@
 """Index module."""
 
+import functools
 from typing import Any, Callable, Generic, Optional, TypeVar
 
 import sqlalchemy as sql
@@ -11,37 +12,112 @@ EntityType = TypeVar("EntityType", bound=Any)  # pylint: disable=invalid-name
 
 
 class DatabaseIndex(Generic[EntityType]):
-    """Database index."""
+    """Database index.
+
+    Args:
+        session (orm.Session): The SQLAlchemy session to use for database operations
+        entity (EntityType): The SQLAlchemy model (or tuple of models) to index
+        count_key (Callable[[EntityType], Any]): Derives the column to count from
+            the entity
+        statement_visitors (Optional[list[StatementVisitor]]): List of statement
+            visitors to apply to all statements
+        core_mode (bool): If True, ``get`` selects the entity's table columns and
+            returns plain mapping rows instead of hydrating ORM instances,
+            bypassing the identity map for read-only listings (Optional,
+            defaults to False; single-entity only)
+
+    """
+
+    # The caches and entity-shape specializations are deliberate.
+    # pylint: disable=too-many-instance-attributes
+
+    __slots__ = (
+        "session",
+        "entity",
+        "_statement_visitors",
+        "_visit_fns",
+        "_count_key",
+        "_base_stmt",
+        "_count_stmt",
+        "_materialize",
+        "_visited_index_cache",
+        "_visited_count_cache",
+    )
 
     def __init__(
         self,
         session: orm.Session,
         entity: EntityType,
-        count_key: Callable[[EntityType], Any],
+        count_key: Callable[[Any], Any],
         statement_visitors: Optional[list[StatementVisitor]] = None,
+        core_mode: bool = False,
     ):
         self.session = session
         self.entity = entity
         self._statement_visitors = statement_visitors or []
+        self._visit_fns = tuple(
+            visitor.visit_statement for visitor in self._statement_visitors
+        )
         self._count_key = count_key
+        # Select objects are immutable, so the bases are built once and
+        # shared; generative methods on them return copies.
+        if core_mode:
+            if isinstance(entity, tuple):
+                raise ValueError("core_mode requires a single entity")
+            self._base_stmt = sql.select(*entity.__table__.c)
+            self._materialize = lambda result: [*result.mappings()]
+            self._count_stmt = sql.select(sql.func.count()).select_from(
+                entity.__table__
+            )
+        elif isinstance(entity, tuple):
+            self._base_stmt = sql.select(*entity)
+            self._materialize = lambda result: [*result.unique().all()]
+            self._count_stmt = sql.select(sql.func.count(count_key(entity)))
+        else:
+            self._base_stmt = sql.select(entity)
+            self._materialize = lambda result: [*result.unique().scalars().all()]
+            self._count_stmt = sql.select(sql.func.count(count_key(entity)))
+        self._visited_index_cache = functools.lru_cache(maxsize=128)(
+            self._apply_index_visitors
+        )
+        self._visited_count_cache = functools.lru_cache(maxsize=128)(
+            self._apply_count_visitors
+        )
+
+    def _apply_index_visitors(self, kwargs_items: frozenset) -> Any:
+        stmt = self._base_stmt
+        kwargs = dict(kwargs_items)
+        for visit in self._visit_fns:
+            stmt = visit(stmt, kwargs)
+        return stmt
+
+    def _apply_count_visitors(self, kwargs_items: frozenset) -> Any:
+        stmt = self._count_stmt
+        kwargs = dict(kwargs_items)
+        for visit in self._visit_fns:
+            stmt = visit(stmt, kwargs)
+        return stmt
 
     def get(self, page_params=None, **kwargs) -> list[Any]:
         """Get a list resources from storage."""
-        if isinstance(self.entity, tuple):
-            stmt = sql.select(*self.entity)
-        else:
-            stmt = sql.select(self.entity)
-        for visitor in self._statement_visitors:
-            stmt = visitor.visit_statement(stmt, kwargs)
+        try:
+            stmt = self._visited_index_cache(frozenset(kwargs.items()))
+        except TypeError:
+            # Unhashable visitor params cannot key the cache; apply the
+            # visitors directly.
+            stmt = self._base_stmt
+            for visit in self._visit_fns:
+                stmt = visit(stmt, kwargs)
         if page_params:
             stmt = stmt.limit(page_params.page_size).offset(page_params.first_item)
-        if isinstance(self.entity, tuple):
-            return [*self.session.execute(stmt).unique().all()]
-        return [*self.session.execute(stmt).unique().scalars().all()]
+        return self._materialize(self.session.execute(stmt))
 
     def count_index(self, **kwargs) -> int:
         """Count resources in storage."""
-        stmt = sql.select(sql.func.count(self._count_key(self.entity)))
-        for visitor in self._statement_visitors:
-            stmt = visitor.visit_statement(stmt, kwargs)
+        try:
+            stmt = self._visited_count_cache(frozenset(kwargs.items()))
+        except TypeError:
+            stmt = self._count_stmt
+            for visit in self._visit_fns:
+                stmt = visit(stmt, kwargs)
         return self.session.execute(stmt).unique().scalar_one()
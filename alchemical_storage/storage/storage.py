@@ -2,11 +2,13 @@
 
 import abc
 import functools
-from typing import Any, Generic, Iterable, Optional, Sequence, Type, TypeVar
+import operator
+from typing import Any, Generic, Optional, Sequence, Type, TypeVar
 
 import sqlalchemy as sql
 from marshmallow_sqlalchemy import SQLAlchemySchema
 from sqlalchemy.orm import DeclarativeBase, Session
+from sqlalchemy.orm.util import identity_key
 
 from alchemical_storage.storage.index import DatabaseIndex
 from alchemical_storage.visitor import StatementVisitor
@@ -16,6 +18,15 @@ from .exc import ConflictError, NotFoundError
 AlchemyModel = TypeVar("AlchemyModel", bound=DeclarativeBase)
 
 
+def _identity_tuple(identity: Any) -> tuple:
+    """Normalize a resource identity to a tuple."""
+    if type(identity) is tuple:  # pylint: disable=unidiomatic-typecheck
+        return identity
+    if isinstance(identity, (str, bytes)) or not hasattr(identity, "__iter__"):
+        return (identity,)
+    return tuple(identity)
+
+
 class StorageABC(abc.ABC, Generic[AlchemyModel]):
     """Resource storage protocol."""
 
@@ -112,111 +123,241 @@ class DatabaseStorage(StorageABC, DatabaseIndex, Generic[AlchemyModel]):
             defaults to "slug")
         statement_visitors (Optional[list[StatementVisitor]]): List of statement
             visitors to apply to all statements
+        core_mode (bool): If True, ``index`` returns plain mapping rows instead of
+            ORM instances, skipping entity hydration on read-only listings
+            (Optional, defaults to False)
 
     """
 
+    # The precompiled statements and primary-key metadata are deliberate.
+    # pylint: disable=too-many-instance-attributes
+
     session: Session
     entity: Type[AlchemyModel]
     storage_schema: SQLAlchemySchema
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         session,
         entity: Type[AlchemyModel],
         storage_schema: SQLAlchemySchema,
         primary_key: str | Sequence[str] = "slug",
         statement_visitors: Optional[list[StatementVisitor]] = None,
+        core_mode: bool = False,
     ):
         self.session = session
         self.entity = entity
         self.storage_schema = storage_schema
         self._statement_visitors = statement_visitors or []
+        self._attr: tuple[str, ...]
         if isinstance(primary_key, str):
-            self._attr = [primary_key]
+            self._attr = (primary_key,)
         else:
-            self._attr = list(primary_key)
+            self._attr = tuple(primary_key)
+        self._pk_cols = tuple(getattr(entity, attr) for attr in self._attr)
+        self._pk_names = tuple(f"pk_{i}" for i in range(len(self._pk_cols)))
+        self._single_pk = len(self._pk_cols) == 1
+        # The identity columns are not required to be the mapper's primary
+        # key (the default "slug" usually is not); Session.get and
+        # identity_key only understand the real primary key, so the fast
+        # paths that use them are gated on this flag.
+        mapper = sql.inspect(entity)
+        mapper_pk_attrs = tuple(
+            mapper.get_property_by_column(col).key for col in mapper.primary_key
+        )
+        self._attr_is_mapper_pk = set(self._attr) == set(mapper_pk_attrs)
+        if self._attr_is_mapper_pk:
+            # identity_key takes PK values in mapper column order, which may
+            # differ from the order identities are given in.
+            self._mapper_pk_order = tuple(
+                self._attr.index(attr) for attr in mapper_pk_attrs
+            )
+        pk_conditions = tuple(
+            col == sql.bindparam(name)
+            for col, name in zip(self._pk_cols, self._pk_names)
+        )
+        self._get_stmt = sql.select(entity).where(*pk_conditions).limit(1)
+        self._visited_stmt_cache = functools.lru_cache(maxsize=128)(
+            self._apply_visitors
+        )
+        self._contains_stmt = (
+            sql.select(sql.literal(True)).where(*pk_conditions).limit(1)
+        )
         DatabaseIndex.__init__(
             self,
             session,
             entity,
-            lambda entity: getattr(entity, self._attr[0]),
+            operator.attrgetter(self._attr[0]),
             statement_visitors=statement_visitors,
+            core_mode=core_mode,
         )
 
     @staticmethod
     def _convert_identity(func):
         """Ensures that the identity of the resource is passed to the decorated function
-        as a tuple."""
+        as a tuple.
+
+        The decorated functions are always methods, so the identity position is
+        fixed and iterability is detected with a cheap ``__iter__`` check instead
+        of the abc machinery behind ``isinstance(..., Iterable)``.
+        """
 
         @functools.wraps(func)
-        def decorator(*args, **kwargs):
-            argslist = list(args)
-            identity_index = int(isinstance(args[0], StorageABC))
-            identity = args[identity_index]
-            if not isinstance(identity, Iterable) or isinstance(identity, (str, bytes)):
-                identity = (identity,)
-            else:
-                identity = tuple(identity)
-            argslist[identity_index] = identity
-            return func(*argslist, **kwargs)
+        def decorator(self, identity, *args, **kwargs):
+            return func(self, _identity_tuple(identity), *args, **kwargs)
 
         return decorator
 
+    def _apply_visitors(self, kwargs_items: frozenset) -> Any:
+        stmt = self._get_stmt
+        kwargs = dict(kwargs_items)
+        for visit in self._visit_fns:
+            stmt = visit(stmt, kwargs)
+        return stmt
+
+    def _pk_params(self, identity: tuple) -> dict[str, Any]:
+        if self._single_pk:
+            return {"pk_0": identity[0]}
+        return dict(zip(self._pk_names, identity))
+
     @_convert_identity
     def get(self, identity: Any, **kwargs) -> AlchemyModel:
-        stmt = sql.select(self.entity).where(
-            *(
-                getattr(self.entity, _attr) == id
-                for _attr, id in zip(self._attr, identity)
-            )
-        )
-        for visitor in self._statement_visitors:
-            stmt = visitor.visit_statement(stmt, kwargs)
-        if model := self.session.execute(stmt).scalars().first():
+        if not self._visit_fns and self._attr_is_mapper_pk:
+            # No visitor is configured (even param-less ones must always run)
+            # and the identity is the mapper's primary key, so take
+            # Session.get's identity-map fast path: repeated lookups of a
+            # loaded row skip SQL entirely. The dict form keys the identity
+            # by attribute name, keeping composite keys order-independent.
+            model = self.session.get(self.entity, dict(zip(self._attr, identity)))
+            if model is None:
+                raise NotFoundError
             return model
-        raise NotFoundError
+        try:
+            stmt = self._visited_stmt_cache(frozenset(kwargs.items()))
+        except TypeError:
+            # Unhashable visitor params cannot key the cache; apply the
+            # visitors directly.
+            stmt = self._get_stmt
+            for visit in self._visit_fns:
+                stmt = visit(stmt, kwargs)
+        model = self.session.execute(
+            stmt, self._pk_params(identity)
+        ).scalar_one_or_none()
+        if model is None:
+            raise NotFoundError
+        return model
 
-    def index(self, page_params=None, **kwargs) -> list[AlchemyModel]:
-        return DatabaseIndex.get(self, page_params, **kwargs)
+    # The index methods are pure delegations to DatabaseIndex; aliasing the
+    # functions directly avoids a wrapper frame per call. mypy rejects the
+    # wider self type against the StorageABC declarations, so the
+    # assignments are ignored explicitly.
+    index = DatabaseIndex.get  # type: ignore[assignment]
 
-    def count_index(self, **kwargs) -> int:
-        return DatabaseIndex.count_index(self, **kwargs)
+    count_index = DatabaseIndex.count_index  # type: ignore[assignment]
 
     @_convert_identity
     def put(self, identity: Any, data: dict[str, Any]) -> AlchemyModel:
-        if identity in self:
+        if self._attr_is_mapper_pk:
+            # Catch conflicts with rows already loaded in memory; identity_key
+            # only speaks the mapper's primary key (in mapper column order),
+            # so the database-backed IntegrityError path below covers the
+            # rest.
+            key = identity_key(
+                self.entity,
+                tuple(identity[i] for i in self._mapper_pk_order),
+            )
+            if key in self.session.identity_map:
+                raise ConflictError
+        elif identity in self:
+            # Identity columns that are not the mapper primary key may carry
+            # no database uniqueness constraint, so IntegrityError cannot be
+            # relied on; check existence with the precompiled statement.
             raise ConflictError
-        data = {**data, **dict(zip(self._attr, identity))}
-        new = self.storage_schema.load(data)
+        data = dict(data)
+        if self._single_pk:
+            data[self._attr[0]] = identity[0]
+        else:
+            data.update(zip(self._attr, identity))
+        # Load transient so an existing row is not silently merged; the
+        # uniqueness check is left to the database instead of a pre-check
+        # SELECT, which was racy and doubled the round-trips.
+        new = self.storage_schema.load(data, transient=True)
         self.session.add(new)
-        self.session.flush()
+        try:
+            self.session.flush()
+        except sql.exc.IntegrityError as error:
+            raise ConflictError from error
         return new
 
     @_convert_identity
     def patch(self, identity: Any, data: dict[str, Any]) -> AlchemyModel:
-        if not identity in self:
-            raise NotFoundError
-        self.storage_schema.load(data, partial=True, instance=self.get(identity))
+        model = self.get(identity)
+        self.storage_schema.load(data, partial=True, instance=model)
         self.session.flush()
-        return self.get(identity)
+        return model
+
+    def put_many(self, items: Sequence[tuple[Any, dict[str, Any]]]) -> None:
+        """Put many new resources to storage with a single bulk INSERT.
+
+        The rows are inserted through SQLAlchemy's ``insertmanyvalues`` path,
+        bypassing the marshmallow schema and the ORM unit of work; callers are
+        responsible for passing already-valid column values, and objects
+        already loaded in the session's identity map are left stale. Very
+        large ingests should be chunked into batches of a few thousand rows.
+
+        Args:
+            items (Sequence[tuple[Any, dict[str, Any]]]): Pairs of resource
+                identifier and column values for each new resource
+
+        Raises:
+            ConflictError: If any of the resources already exist, provided the
+                identity columns carry a database uniqueness constraint;
+                unlike ``put``, no existence pre-check is made for identity
+                columns without one
+
+        """
+        rows = [
+            {**data, **dict(zip(self._attr, _identity_tuple(identity)))}
+            for identity, data in items
+        ]
+        if not rows:
+            return
+        try:
+            self.session.execute(sql.insert(self.entity), rows)
+        except sql.exc.IntegrityError as error:
+            raise ConflictError from error
+
+    def delete_many(self, identities: Sequence[Any]) -> None:
+        """Delete many resources from storage with a single DELETE.
+
+        Resources that do not exist are ignored. The DELETE bypasses the ORM
+        unit of work, so relationship cascades do not run and objects already
+        loaded in the session's identity map are left stale.
+
+        Args:
+            identities (Sequence[Any]): The resource identifiers
+
+        """
+        ids = [_identity_tuple(identity) for identity in identities]
+        if not ids:
+            return
+        if self._single_pk:
+            condition = self._pk_cols[0].in_([identity[0] for identity in ids])
+        else:
+            condition = sql.tuple_(*self._pk_cols).in_(ids)
+        self.session.execute(sql.delete(self.entity).where(condition))
 
     @_convert_identity
     def delete(self, identity: Any) -> AlchemyModel:
-        if not identity in self:
-            raise NotFoundError
         model = self.get(identity)
         self.session.delete(model)
         return model
 
     @_convert_identity
     def __contains__(self, identity: Any) -> bool:
-        if result := self.session.execute(
-            sql.select(sql.func.count(getattr(self.entity, self._attr[0]))).where(
-                *(
-                    getattr(self.entity, _attr) == id
-                    for _attr, id in zip(self._attr, identity)
-                )
-            )
-        ).scalar():
-            return result > 0
-        return False
+        return (
+            self.session.execute(
+                self._contains_stmt, self._pk_params(identity)
+            ).scalar()
+            is not None
+        )
@@ -11,6 +11,8 @@ T = TypeVar("T", sql.Select, sql.ColumnElement)
 class StatementVisitor(abc.ABC):
     """Visitor class for sqlalchemy statements."""
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def visit_statement(self, statement: T, params: dict[str, Any]) -> T:
         """Visit a statement.
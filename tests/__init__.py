@@ -4,11 +4,7 @@ from typing import Any
 def _dict_to_params(
     test_cases: dict[str, Any],
 ):
-    args = {
-        "argvalues": [],
-        "ids": [],
+    return {
+        "argvalues": tuple(test_cases.values()),
+        "ids": tuple(test_cases.keys()),
     }
-    for key, value in test_cases.items():
-        args["argvalues"].append(value)
-        args["ids"].append(key)
-    return args
@@ -0,0 +1,68 @@
+"""Shared fixtures for the test suite."""
+
+from types import SimpleNamespace
+
+import pytest
+import sqlalchemy as sa
+
+from tests import models
+
+# pylint: disable=too-few-public-methods
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """Create a shared in-memory engine so the schema DDL runs once per run.
+
+    Tests isolate themselves by running inside a connection-level transaction
+    that their session fixture rolls back at teardown.
+    """
+    engine = sa.create_engine("sqlite:///:memory:", poolclass=sa.pool.StaticPool)
+
+    # pysqlite's implicit transaction handling breaks SAVEPOINTs; take over
+    # BEGIN emission as documented in the SQLAlchemy pysqlite dialect notes.
+    @sa.event.listens_for(engine, "connect")
+    def _do_connect(dbapi_connection, _connection_record):
+        dbapi_connection.isolation_level = None
+
+    @sa.event.listens_for(engine, "begin")
+    def _do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    models.Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+class _CallRecorder:
+    """Record the last call to a statement method, mimicking ``Mock.call_args``."""
+
+    __slots__ = ("call_args",)
+
+    def __init__(self):
+        self.call_args = None
+
+    def __call__(self, *args, **kwargs):
+        self.call_args = SimpleNamespace(args=args, kwargs=kwargs)
+
+
+class _FakeSelect:
+    """Minimal stand-in for ``sqlalchemy.Select`` that records clause calls.
+
+    ``Mock(spec=sqlalchemy.Select)`` introspects the whole ``Select`` API on
+    every construction; this stub only provides the methods the visitors call,
+    which keeps the clause-assertion tests fast.
+    """
+
+    __slots__ = ("where", "order_by", "join")
+
+    def __init__(self):
+        self.where = _CallRecorder()
+        self.order_by = _CallRecorder()
+        self.join = _CallRecorder()
+
+
+@pytest.fixture(scope="function")
+def mock_sql_statement_fast():
+    """A lightweight statement stub for tests that only inspect clause args."""
+    return _FakeSelect()
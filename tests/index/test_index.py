@@ -1,5 +1,4 @@
 import pytest
-import sqlalchemy as sa
 from sqlalchemy import orm
 from sqlalchemy.sql.elements import ColumnElement
 
@@ -10,11 +9,11 @@ from tests import models
 
 
 @pytest.fixture
-def session(existing_models: list[models.Model]):
-    """Create a session for testing."""
-    engine = sa.create_engine("sqlite:///:memory:")
-    models.Base.metadata.create_all(bind=engine)
-    session = orm.sessionmaker(bind=engine)()
+def session(engine, existing_models: list[models.Model]):
+    """Create a session for testing, rolled back after each test."""
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = orm.Session(bind=connection, join_transaction_mode="create_savepoint")
     session.add_all(existing_models)
     session.add_all(
         [
@@ -24,7 +23,8 @@ def session(existing_models: list[models.Model]):
     session.commit()
     yield session
     session.close()
-    # models.Base.metadata.drop_all(bind=engine)
+    transaction.rollback()
+    connection.close()
 
 
 @pytest.fixture
@@ -1,6 +1,7 @@
 """Test the filter class."""
 
 import operator
+from types import ModuleType
 from unittest.mock import Mock
 
 import pytest
@@ -10,8 +11,8 @@ from sqlalchemy import BinaryExpression, UnaryExpression
 from sqlalchemy.sql.elements import _textual_label_reference
 from sqlalchemy.sql.operators import desc_op
 
-from alchemical_storage.filter import FilterMap, OrderByMap
-from alchemical_storage.filter.exc import OrderByException
+from alchemical_storage.filter import FilterMap, NullFilterMap, OrderByMap
+from alchemical_storage.filter.exc import NullFilterException, OrderByException
 
 from .models import Model
 
@@ -40,11 +41,11 @@ class TestFilterMap:
             "tests.models",
         )
         # pylint: disable=comparison-with-callable
-        assert filter_instance.filters["filter_name"].func == operator.eq
-        assert filter_instance.filters["filter_name"].args[0] == Model.attr
+        assert filter_instance.filters["filter_name"].__name__ == "__eq__"
+        assert filter_instance.filters["filter_name"].__self__ is Model.attr
 
-        assert filter_instance.filters["filter_name2"].func == operator.ge
-        assert filter_instance.filters["filter_name2"].args[0] == Model.attr2
+        assert filter_instance.filters["filter_name2"].__name__ == "__ge__"
+        assert filter_instance.filters["filter_name2"].__self__ is Model.attr2
 
     @pytest.mark.parametrize(
         "given_filters, expected_left_list, expected_right_value_list",
@@ -60,7 +61,7 @@ class TestFilterMap:
     )
     def test_visit_statement_appends_where_clauses_for_given_filters(
         self,
-        mock_sql_statement: Mock,
+        mock_sql_statement_fast,
         expected_left_list,
         expected_right_value_list,
         given_filters,
@@ -76,9 +77,9 @@ class TestFilterMap:
             },
             "tests.models",
         )
-        filter_instance.visit_statement(mock_sql_statement, given_filters)
+        filter_instance.visit_statement(mock_sql_statement_fast, given_filters)
         for actual, expected_left, expected_right_value in zip(
-            mock_sql_statement.where.call_args.args,
+            mock_sql_statement_fast.where.call_args.args,
             expected_left_list,
             expected_right_value_list,
         ):
@@ -86,6 +87,75 @@ class TestFilterMap:
             assert actual.left == expected_left
             assert actual.right.value == expected_right_value
 
+    def test_init_accepts_module_object(self):
+        """Test that the filter class accepts an already-imported module."""
+        from tests import models  # pylint: disable=import-outside-toplevel
+
+        filter_instance = FilterMap({"filter_name": "Model.attr"}, models)
+        assert filter_instance.filters["filter_name"].__self__ is Model.attr
+
+    def test_init_accepts_module_object_not_importable_by_name(self):
+        """Test that the filter class resolves against the module object itself."""
+        dynamic = ModuleType("dynamic_models")
+        dynamic.Model = Model
+        filter_instance = FilterMap({"filter_name": "Model.attr"}, dynamic)
+        assert filter_instance.filters["filter_name"].__self__ is Model.attr
+
+
+class TestNullFilterMap:
+    """Test the NullFilterMap class."""
+
+    def test_init_initializes_filter_expressions(self):
+        """Test the null filter class."""
+        filter_instance = NullFilterMap({"filter_name": "Model.attr"}, "tests.models")
+        assert filter_instance.filters["filter_name"] is Model.attr
+        assert filter_instance.null_identifiers == ("null", "not-null")
+
+    @pytest.mark.parametrize(
+        "given_filters, expected_operator",
+        [
+            ({"filter_name": "null"}, "IS"),
+            ({"filter_name": "not-null"}, "IS NOT"),
+        ],
+    )
+    def test_visit_statement_appends_where_clauses_for_given_filters(
+        self,
+        mock_sql_statement_fast,
+        given_filters,
+        expected_operator,
+    ):
+        """Test that the null filter class appends where clauses for given filters."""
+        filter_instance = NullFilterMap({"filter_name": "Model.attr"}, "tests.models")
+        filter_instance.visit_statement(mock_sql_statement_fast, given_filters)
+        actual = mock_sql_statement_fast.where.call_args.args[0]
+        assert isinstance(actual, BinaryExpression)
+        assert actual.left == Model.attr
+        assert str(actual).endswith(f"{expected_operator} NULL")
+
+    def test_visit_statement_ignores_unknown_filters(
+        self,
+        mock_sql_statement: Mock,
+    ):
+        """Test that the null filter class ignores unknown filters."""
+        filter_instance = NullFilterMap({"filter_name": "Model.attr"}, "tests.models")
+        actual = filter_instance.visit_statement(mock_sql_statement, {"other": "null"})
+        assert actual is mock_sql_statement
+        mock_sql_statement.where.assert_not_called()
+
+    def test_visit_statement_raises_exception_when_filter_value_is_invalid(
+        self,
+        mock_sql_statement_fast,
+    ):
+        """Test that the null filter class raises an exception when the filter value
+        is invalid."""
+        filter_instance = NullFilterMap({"filter_name": "Model.attr"}, "tests.models")
+        with pytest.raises(
+            NullFilterException, match="^(Unknown null filter value: invalid)$"
+        ):
+            filter_instance.visit_statement(
+                mock_sql_statement_fast, {"filter_name": "invalid"}
+            )
+
 
 class TestOrderByMap:
     """Test the OrderByMap class."""
@@ -98,7 +168,7 @@ class TestOrderByMap:
 
     def test_visit_statement_appends_order_by_clauses_for_given_order_by(
         self,
-        mock_sql_statement: Mock,
+        mock_sql_statement_fast,
     ):
         """Test that the order by map class appends order by clauses for given order
         by."""
@@ -112,18 +182,18 @@ class TestOrderByMap:
             "tests.models",
         )
         order_by_instance.visit_statement(
-            mock_sql_statement, {"order_by": "order_by_name,-order_by_name2"}
+            mock_sql_statement_fast, {"order_by": "order_by_name,-order_by_name2"}
         )
-        assert mock_sql_statement.order_by.call_args.args[0] == Model.attr
+        assert mock_sql_statement_fast.order_by.call_args.args[0] == Model.attr
         assert isinstance(
-            mock_sql_statement.order_by.call_args.args[1], UnaryExpression
+            mock_sql_statement_fast.order_by.call_args.args[1], UnaryExpression
         )
-        assert mock_sql_statement.order_by.call_args.args[1].element == Model.attr2
-        assert mock_sql_statement.order_by.call_args.args[1].modifier == desc_op
+        assert mock_sql_statement_fast.order_by.call_args.args[1].element == Model.attr2
+        assert mock_sql_statement_fast.order_by.call_args.args[1].modifier == desc_op
 
     def test_visit_statement_appends_order_by_clauses_for_given_order_by_with_label(
         self,
-        mock_sql_statement: Mock,
+        mock_sql_statement_fast,
     ):
         """Test that the order by map class appends order by clauses for given order by
         with label."""
@@ -137,24 +207,25 @@ class TestOrderByMap:
             "tests.models",
         )
         order_by_instance.visit_statement(
-            mock_sql_statement, {"order_by": "order_by_name,-order_by_name2"}
+            mock_sql_statement_fast, {"order_by": "order_by_name,-order_by_name2"}
         )
-        assert mock_sql_statement.order_by.call_args.args[0] == "col_label"
+        assert mock_sql_statement_fast.order_by.call_args.args[0] == "col_label"
         assert isinstance(
-            mock_sql_statement.order_by.call_args.args[1], UnaryExpression
+            mock_sql_statement_fast.order_by.call_args.args[1], UnaryExpression
         )
         assert isinstance(
-            mock_sql_statement.order_by.call_args.args[1].element,
+            mock_sql_statement_fast.order_by.call_args.args[1].element,
             _textual_label_reference,
         )
         assert (
-            mock_sql_statement.order_by.call_args.args[1].element.element == "exp_label"
+            mock_sql_statement_fast.order_by.call_args.args[1].element.element
+            == "exp_label"
         )
-        assert mock_sql_statement.order_by.call_args.args[1].modifier == desc_op
+        assert mock_sql_statement_fast.order_by.call_args.args[1].modifier == desc_op
 
-    def test_visit_statement_appends_order_by_clauses_for_given_order_by_with_label_and_attr(
+    def test_visit_statement_appends_order_by_clauses_for_label_and_attr(
         self,
-        mock_sql_statement: Mock,
+        mock_sql_statement_fast,
     ):
         """Test that the order by map class appends order by clauses for given order by
         with label and attr."""
@@ -168,18 +239,18 @@ class TestOrderByMap:
             "tests.models",
         )
         order_by_instance.visit_statement(
-            mock_sql_statement, {"order_by": "order_by_name,-order_by_name2"}
+            mock_sql_statement_fast, {"order_by": "order_by_name,-order_by_name2"}
         )
-        assert mock_sql_statement.order_by.call_args.args[0] == "col_label"
+        assert mock_sql_statement_fast.order_by.call_args.args[0] == "col_label"
         assert isinstance(
-            mock_sql_statement.order_by.call_args.args[1], UnaryExpression
+            mock_sql_statement_fast.order_by.call_args.args[1], UnaryExpression
         )
-        assert mock_sql_statement.order_by.call_args.args[1].element == Model.attr
-        assert mock_sql_statement.order_by.call_args.args[1].modifier == desc_op
+        assert mock_sql_statement_fast.order_by.call_args.args[1].element == Model.attr
+        assert mock_sql_statement_fast.order_by.call_args.args[1].modifier == desc_op
 
     def test_visit_statement_raises_exception_when_order_by_query_param_is_invalid(
         self,
-        mock_sql_statement: Mock,
+        mock_sql_statement_fast,
     ):
         """Test that the order by map class raises an exception when the order by query
         param is invalid."""
@@ -194,5 +265,5 @@ class TestOrderByMap:
             OrderByException, match="^(Unknown order_by attribute: invalid_param)$"
         ):
             order_by_instance.visit_statement(
-                mock_sql_statement, {"order_by": "order_by_name,invalid_param"}
+                mock_sql_statement_fast, {"order_by": "order_by_name,invalid_param"}
             )
@@ -0,0 +1,58 @@
+"""Test the pagination module."""
+
+from unittest.mock import Mock
+
+import pytest
+import pytest_mock
+import sqlalchemy
+
+from alchemical_storage.pagination import PaginationMap
+from tests.models import PageParams
+
+# pylint: disable=too-few-public-methods,redefined-outer-name
+
+
+@pytest.fixture(scope="function")
+def mock_sql_statement(mocker: pytest_mock.MockerFixture):
+    """Mock the sqlalchemy statement."""
+    return mocker.Mock(spec=sqlalchemy.Select)
+
+
+class TestPaginationMap:
+    """Test the PaginationMap class."""
+
+    def test_visit_statement_applies_limit_and_offset(self, mock_sql_statement: Mock):
+        """Test that the pagination map applies limit and offset."""
+        pagination_instance = PaginationMap()
+        pagination_instance.visit_statement(
+            mock_sql_statement, {"page_params": PageParams(5, 10)}
+        )
+        mock_sql_statement.limit.assert_called_once_with(5)
+        mock_sql_statement.limit.return_value.offset.assert_called_once_with(10)
+
+    def test_visit_statement_ignores_missing_page_params(
+        self, mock_sql_statement: Mock
+    ):
+        """Test that the pagination map ignores params without page params."""
+        pagination_instance = PaginationMap()
+        actual = pagination_instance.visit_statement(mock_sql_statement, {})
+        assert actual is mock_sql_statement
+        mock_sql_statement.limit.assert_not_called()
+
+    def test_visit_statement_ignores_falsy_page_size(self, mock_sql_statement: Mock):
+        """Test that the pagination map ignores page params with a falsy page size."""
+        pagination_instance = PaginationMap()
+        actual = pagination_instance.visit_statement(
+            mock_sql_statement, {"page_params": PageParams(0, 0)}
+        )
+        assert actual is mock_sql_statement
+        mock_sql_statement.limit.assert_not_called()
+
+    def test_visit_statement_uses_custom_getter_func(self, mock_sql_statement: Mock):
+        """Test that the pagination map uses a custom getter function."""
+        pagination_instance = PaginationMap(getter_func=lambda obj, attr: obj[attr])
+        pagination_instance.visit_statement(
+            mock_sql_statement, {"page_params": {"page_size": 5, "first_item": 10}}
+        )
+        mock_sql_statement.limit.assert_called_once_with(5)
+        mock_sql_statement.limit.return_value.offset.assert_called_once_with(10)
@@ -1,7 +1,6 @@
 """Test the database storage class."""
 
 import pytest
-import sqlalchemy as sa
 from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
 from sqlalchemy import orm
 from sqlalchemy.sql.expression import ColumnElement
@@ -11,6 +10,7 @@ from alchemical_storage.filter.filter import OrderByMap
 from alchemical_storage.join import JoinMap
 from alchemical_storage.storage import DatabaseStorage
 from alchemical_storage.storage.exc import ConflictError, NotFoundError
+from alchemical_storage.visitor import StatementVisitor
 from tests import models
 
 # pylint: disable=too-many-public-methods, too-many-arguments, too-few-public-methods, missing-class-docstring, missing-function-docstring
@@ -20,11 +20,11 @@ class TestDatabaseStorageWithSinglePk:
     """Test the database storage class."""
 
     @pytest.fixture
-    def session(self, existing_models: list[models.Model]):
-        """Create a session for testing."""
-        engine = sa.create_engine("sqlite:///:memory:")
-        models.Base.metadata.create_all(bind=engine)
-        session = orm.sessionmaker(bind=engine)()
+    def session(self, engine, existing_models: list[models.Model]):
+        """Create a session for testing, rolled back after each test."""
+        connection = engine.connect()
+        transaction = connection.begin()
+        session = orm.Session(bind=connection, join_transaction_mode="create_savepoint")
         session.add_all(existing_models)
         session.add_all(
             [
@@ -34,7 +34,8 @@ class TestDatabaseStorageWithSinglePk:
         session.commit()
         yield session
         session.close()
-        models.Base.metadata.drop_all(bind=engine)
+        transaction.rollback()
+        connection.close()
 
     @pytest.fixture
     def entity_filters(self):
@@ -111,6 +112,52 @@ class TestDatabaseStorageWithSinglePk:
         assert model.attr3 == "test1"
         assert existing_models[0] == model
 
+    @pytest.fixture
+    def non_pk_model_storage(self, session, model_schema):
+        """Create a DatabaseStorage instance keyed by a non-primary-key column."""
+        return DatabaseStorage(
+            session,
+            models.Model,
+            model_schema,
+            primary_key="attr3",
+        )
+
+    def test_model_storage_get_by_non_primary_key_column(
+        self, non_pk_model_storage: DatabaseStorage[models.Model], existing_models
+    ):
+        """Test that get works when the identity is not the mapper primary key."""
+        assert non_pk_model_storage.get("test1") == existing_models[0]
+        with pytest.raises(NotFoundError):
+            non_pk_model_storage.get("notfound")
+
+    def test_model_storage_put_raises_conflict_error_for_non_primary_key_column(
+        self, non_pk_model_storage: DatabaseStorage[models.Model]
+    ):
+        """Test that put detects conflicts on an identity column without a
+        database uniqueness constraint."""
+        with pytest.raises(ConflictError):
+            non_pk_model_storage.put("test1", {"attr2": 5})
+
+    def test_model_storage_get_applies_visitors_that_ignore_params(
+        self, session, model_schema, existing_models
+    ):
+        """Test that get applies always-on visitors even without kwargs."""
+
+        class _AlwaysFilter(StatementVisitor):
+            def visit_statement(self, statement, params):
+                return statement.where(models.Model.attr > 1)
+
+        storage = DatabaseStorage(
+            session,
+            models.Model,
+            model_schema,
+            primary_key="attr",
+            statement_visitors=[_AlwaysFilter()],
+        )
+        assert storage.get(3) == existing_models[1]
+        with pytest.raises(NotFoundError):
+            storage.get(1)
+
     def test_model_storage_put_inserts_new_model(
         self, model_storage: DatabaseStorage[models.Model]
     ):
@@ -129,6 +176,34 @@ class TestDatabaseStorageWithSinglePk:
         with pytest.raises(ConflictError):
             model_storage.put(1, {"attr2": 2, "attr3": "test2"})
 
+    def test_model_storage_put_many_inserts_new_models(
+        self, model_storage: DatabaseStorage[models.Model]
+    ):
+        """Test that put_many inserts new models."""
+        model_storage.put_many(
+            [
+                (2, {"attr2": 2, "attr3": "test2"}),
+                (4, {"attr2": 4, "attr3": "test4"}),
+            ]
+        )
+        assert model_storage.count_index() == 4
+        assert model_storage.get(2).attr3 == "test2"
+        assert model_storage.get(4).attr3 == "test4"
+
+    def test_model_storage_put_many_raises_conflict_error_if_model_already_exists(
+        self, model_storage: DatabaseStorage[models.Model]
+    ):
+        """Test that put_many raises ConflictError if a model already exists."""
+        with pytest.raises(ConflictError):
+            model_storage.put_many([(1, {"attr2": 2, "attr3": "test2"})])
+
+    def test_model_storage_delete_many_deletes_models(
+        self, model_storage: DatabaseStorage[models.Model]
+    ):
+        """Test that delete_many deletes models."""
+        model_storage.delete_many([1, 3])
+        assert model_storage.count_index() == 0
+
     def test_model_storage_patch_updates_existing_model(
         self, model_storage: DatabaseStorage[models.Model], existing_models
     ):
@@ -212,21 +287,50 @@ class TestDatabaseStorageWithSinglePk:
         """Test that count_index returns count of models."""
         assert model_storage.count_index(**filters) == expected_count
 
+    @pytest.fixture
+    def core_model_storage(
+        self, session, model_schema, joins, entity_filters, entity_order_by
+    ):
+        """Create a DatabaseStorage instance in core mode."""
+        return DatabaseStorage(
+            session,
+            models.Model,
+            model_schema,
+            primary_key="attr",
+            statement_visitors=[entity_filters, entity_order_by, joins],
+            core_mode=True,
+        )
+
+    def test_core_mode_index_returns_mapping_rows(
+        self, core_model_storage: DatabaseStorage[models.Model]
+    ):
+        """Test that index returns mapping rows instead of models in core mode."""
+        actual = core_model_storage.index(order_by="attr2")
+        assert [row["attr"] for row in actual] == [1, 3]
+        assert actual[0]["attr3"] == "test1"
+
+    def test_core_mode_count_index_returns_count_of_models(
+        self, core_model_storage: DatabaseStorage[models.Model]
+    ):
+        """Test that count_index returns count of models in core mode."""
+        assert core_model_storage.count_index(attr3_like="%test%") == 2
+
 
 class TestDatabaseStorageWithCompositePk:
     """Tests for composite pk models."""
 
     @pytest.fixture
-    def session(self, existing_models: list[models.CompositePkModel]):
-        """Create a session for testing."""
-        engine = sa.create_engine("sqlite:///:memory:")
-        models.Base.metadata.create_all(bind=engine)
-        session = orm.sessionmaker(bind=engine)()
+    def session(self, engine, existing_models: list[models.CompositePkModel]):
+        """Create a session for testing, rolled back after each test."""
+        connection = engine.connect()
+        transaction = connection.begin()
+        session = orm.Session(bind=connection, join_transaction_mode="create_savepoint")
         session.add_all(existing_models)
         session.commit()
         yield session
         session.close()
-        models.Base.metadata.drop_all(bind=engine)
+        transaction.rollback()
+        connection.close()
 
     @pytest.fixture
     def existing_models(self):
@@ -314,6 +418,41 @@ class TestDatabaseStorageWithCompositePk:
         with pytest.raises(ConflictError):
             model_storage.put((1, 1), {"attr3": "test2"})
 
+    def test_model_storage_put_raises_conflict_error_with_reordered_primary_key(
+        self, session, model_schema
+    ):
+        """Test that put detects conflicts when the key order differs from the
+        mapper's column order."""
+        storage = DatabaseStorage(
+            session,
+            models.CompositePkModel,
+            model_schema,
+            primary_key=("attr2", "attr"),
+        )
+        with pytest.raises(ConflictError):
+            storage.put((2, 1), {"attr3": "test3"})
+
+    def test_model_storage_put_many_inserts_new_models(
+        self, model_storage: DatabaseStorage[models.CompositePkModel]
+    ):
+        """Test that put_many inserts new models."""
+        model_storage.put_many(
+            [
+                ((1, 3), {"attr3": "test3"}),
+                ((2, 1), {"attr3": "test4"}),
+            ]
+        )
+        assert model_storage.count_index() == 4
+        assert model_storage.get((1, 3)).attr3 == "test3"
+        assert model_storage.get((2, 1)).attr3 == "test4"
+
+    def test_model_storage_delete_many_deletes_models(
+        self, model_storage: DatabaseStorage[models.CompositePkModel]
+    ):
+        """Test that delete_many deletes models."""
+        model_storage.delete_many([(1, 1), (1, 2)])
+        assert model_storage.count_index() == 0
+
     def test_model_storage_patch_updates_existing_model(
         self, model_storage: DatabaseStorage[models.CompositePkModel], existing_models
     ):